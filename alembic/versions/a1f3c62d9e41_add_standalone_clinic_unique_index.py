@@ -0,0 +1,34 @@
+"""add standalone clinic unique index
+
+Revision ID: a1f3c62d9e41
+Revises: d64762c7874a
+Create Date: 2026-08-26 09:14:52.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1f3c62d9e41'
+down_revision: Union[str, Sequence[str], None] = 'd64762c7874a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'uq_clinics_owner_name_standalone',
+        'registered_clinics',
+        ['owner_id', 'clinic_name'],
+        unique=True,
+        postgresql_where=sa.text('dso_id IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_clinics_owner_name_standalone', table_name='registered_clinics')
@@ -0,0 +1,54 @@
+"""drop redundant pk id indexes
+
+Revision ID: a8c5d1f7e402
+Revises: d4a7e95f1c38
+Create Date: 2026-08-26 11:52:09.134557
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8c5d1f7e402'
+down_revision: Union[str, Sequence[str], None] = 'd4a7e95f1c38'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = (
+    'users',
+    'Dsos',
+    'registered_clinics',
+    'patients',
+    'appointments',
+    'inbound_events',
+    'audit_logs',
+    'role_assignments',
+    'member_invites',
+    'appointment_sync_logs',
+    'wallets',
+    'wallet_creation_requests',
+    'billing_subscriptions',
+    'usage_events',
+    'daily_sync_usage_summaries',
+    'wallet_ledger_entries',
+    'wallet_transfers',
+    'payment_transactions',
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # the primary key already owns a unique btree; the index=True/unique=True
+    # flags on Autoid.id had created a second identical index per table
+    for table in TABLES:
+        op.execute(f'DROP INDEX IF EXISTS "ix_{table}_id"')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.create_index(f'ix_{table}_id', table, ['id'], unique=True)
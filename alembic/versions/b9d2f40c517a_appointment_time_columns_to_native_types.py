@@ -0,0 +1,57 @@
+"""appointment time columns to native types
+
+Revision ID: b9d2f40c517a
+Revises: e58a04f7b126
+Create Date: 2026-08-26 11:03:48.771905
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b9d2f40c517a'
+down_revision: Union[str, Sequence[str], None] = 'e58a04f7b126'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        'appointments', 'start_time',
+        type_=sa.DateTime(),
+        existing_nullable=False,
+        postgresql_using='start_time::timestamp',
+    )
+    op.alter_column(
+        'appointments', 'end_time',
+        type_=sa.DateTime(),
+        existing_nullable=False,
+        postgresql_using='end_time::timestamp',
+    )
+    op.alter_column(
+        'appointments', 'date',
+        type_=sa.Date(),
+        existing_nullable=False,
+        postgresql_using='"date"::date',
+    )
+    # NOT VALID: only new/updated rows are checked, so legacy zero-length
+    # appointments (end == start) don't abort the deploy mid-upgrade; run
+    # VALIDATE CONSTRAINT once those rows are cleaned up
+    op.create_check_constraint(
+        'ck_appointments_end_after_start',
+        'appointments',
+        'end_time > start_time',
+        postgresql_not_valid=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('ck_appointments_end_after_start', 'appointments', type_='check')
+    op.alter_column('appointments', 'date', type_=sa.String(), existing_nullable=False)
+    op.alter_column('appointments', 'end_time', type_=sa.String(), existing_nullable=False)
+    op.alter_column('appointments', 'start_time', type_=sa.String(), existing_nullable=False)
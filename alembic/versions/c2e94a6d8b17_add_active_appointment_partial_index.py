@@ -0,0 +1,34 @@
+"""add active appointment partial index
+
+Revision ID: c2e94a6d8b17
+Revises: a8c5d1f7e402
+Create Date: 2026-08-26 12:24:41.905318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2e94a6d8b17'
+down_revision: Union[str, Sequence[str], None] = 'a8c5d1f7e402'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_appt_active',
+        'appointments',
+        ['clinic_id', 'start_time'],
+        unique=False,
+        postgresql_where=sa.text("status NOT IN ('cancelled', 'canceled', 'completed')"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_appt_active', table_name='appointments')
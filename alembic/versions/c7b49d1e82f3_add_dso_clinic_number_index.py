@@ -0,0 +1,28 @@
+"""add dso clinic number index
+
+Revision ID: c7b49d1e82f3
+Revises: a1f3c62d9e41
+Create Date: 2026-08-26 10:02:37.495311
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7b49d1e82f3'
+down_revision: Union[str, Sequence[str], None] = 'a1f3c62d9e41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_registered_clinics_dso_clinic_number', 'registered_clinics', ['dso_id', 'clinic_number'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_registered_clinics_dso_clinic_number', table_name='registered_clinics')
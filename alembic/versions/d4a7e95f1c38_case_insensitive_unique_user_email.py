@@ -0,0 +1,30 @@
+"""case insensitive unique user email
+
+Revision ID: d4a7e95f1c38
+Revises: f31c8be09254
+Create Date: 2026-08-26 11:29:54.612890
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a7e95f1c38'
+down_revision: Union[str, Sequence[str], None] = 'f31c8be09254'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('uq_users_email_lower', 'users', [sa.text('lower(email)')], unique=True)
+    op.drop_constraint('users_email_key', 'users', type_='unique')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_unique_constraint('users_email_key', 'users', ['email'])
+    op.drop_index('uq_users_email_lower', table_name='users')
@@ -0,0 +1,36 @@
+"""add covering lookup indexes
+
+Revision ID: e58a04f7b126
+Revises: c7b49d1e82f3
+Create Date: 2026-08-26 10:41:12.208644
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e58a04f7b126'
+down_revision: Union[str, Sequence[str], None] = 'c7b49d1e82f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_appt_clinic_start',
+        'appointments',
+        ['clinic_id', 'start_time'],
+        unique=False,
+        postgresql_include=['event_id', 'status', 'pat_id'],
+    )
+    op.create_index('ix_patients_clinic_phone', 'patients', ['clinic_id', 'phone'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_patients_clinic_phone', table_name='patients')
+    op.drop_index('ix_appt_clinic_start', table_name='appointments')
@@ -0,0 +1,34 @@
+"""add brin index on appointment start
+
+Revision ID: e7b31c9f2d65
+Revises: c2e94a6d8b17
+Create Date: 2026-08-26 12:39:17.482210
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b31c9f2d65'
+down_revision: Union[str, Sequence[str], None] = 'c2e94a6d8b17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_appt_start_brin',
+        'appointments',
+        ['start_time'],
+        unique=False,
+        postgresql_using='brin',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_appt_start_brin', table_name='appointments')
@@ -0,0 +1,39 @@
+"""operatory calendar map to jsonb
+
+Revision ID: f31c8be09254
+Revises: b9d2f40c517a
+Create Date: 2026-08-26 11:18:26.330472
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f31c8be09254'
+down_revision: Union[str, Sequence[str], None] = 'b9d2f40c517a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        'registered_clinics', 'operatory_calendar_map',
+        type_=postgresql.JSONB(),
+        existing_nullable=True,
+        postgresql_using='operatory_calendar_map::jsonb',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        'registered_clinics', 'operatory_calendar_map',
+        type_=postgresql.JSON(),
+        existing_nullable=True,
+        postgresql_using='operatory_calendar_map::json',
+    )
@@ -0,0 +1,34 @@
+"""resize od identifier columns
+
+Revision ID: fd6c28a4b913
+Revises: e7b31c9f2d65
+Create Date: 2026-08-26 12:58:33.617842
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'fd6c28a4b913'
+down_revision: Union[str, Sequence[str], None] = 'e7b31c9f2d65'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column('registered_clinics', 'clinic_number', type_=sa.BigInteger(), existing_nullable=False)
+    op.alter_column('patients', 'pat_num', type_=sa.BigInteger(), existing_nullable=True)
+    op.alter_column('appointments', 'AptNum', type_=sa.BigInteger(), existing_nullable=True)
+    op.alter_column('appointment_sync_logs', 'apt_num', type_=sa.BigInteger(), existing_nullable=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('appointment_sync_logs', 'apt_num', type_=sa.Integer(), existing_nullable=True)
+    op.alter_column('appointments', 'AptNum', type_=sa.Integer(), existing_nullable=True)
+    op.alter_column('patients', 'pat_num', type_=sa.Integer(), existing_nullable=True)
+    op.alter_column('registered_clinics', 'clinic_number', type_=sa.Integer(), existing_nullable=False)
@@ -1,7 +1,7 @@
 from fastapi import Depends, APIRouter, status, HTTPException, Request
 from sqlalchemy.orm import Session
 from core.database import get_db
-from  core.schemas import cliniccreate
+from  core.schemas import cliniccreate, clinicout
 from auth.oauth2 import get_current_user
 from core.models import Users, RegisteredClinics, Dso, RoleAssignment, ScopeType, RoleType
 from  auth.security import encrypt_secret
@@ -10,7 +10,7 @@ import logging
 import secrets
 from caches.dso_clinic_page_cache import invalidate_dso_clinic_list_cache
 from sqlalchemy.exc import SQLAlchemyError
-from core.schemas import clinicout
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from uuid import UUID
 
 log = logging.getLogger(__name__)
@@ -37,32 +37,39 @@ async def standalone_clinic(payload : cliniccreate,  request: Request, db: Sessi
     for status, items in payload.operatory_calendar_map.items()
 }
 
-    existing = db.query(RegisteredClinics).filter(RegisteredClinics.owner_id == current_user.id, RegisteredClinics.clinic_name == payload.clinic_name, RegisteredClinics.dso_id.is_(None)). first()
-    if existing:
-        log.warning("Duplicate clinic creation attempt", extra={
-            "user_id" : current_user.id,   
-            "clinic_name" : payload.clinic_name,
-            "request_id ": request.state.request_id
-        },)
-        raise HTTPException(status_code = status.HTTP_400_BAD_REQUEST, detail = "You Already have a clinic created already")
-    
-    clinic = RegisteredClinics(
-        crm_type = crm_type,
-        clinic_name = clinic_name ,
-        clinic_number = clinic_number,
-        clinic_timezone = clinic_timezone,
-        od_developer_key = encrypt_secret (od_developer_key),
-        od_customer_key = encrypt_secret(od_customer_key), 
-        crm_api_key = encrypt_secret(crm_api_key),
-        webhook_secret = encrypt_secret(raw_webhook_secret),
-        location_id = location_id,
-        calendar_id = encrypt_secret(calendar_id) ,
-        operatory_calendar_map = operatory_calendar_map,
-        owner_id = current_user.id,
+    stmt = (
+        pg_insert(RegisteredClinics)
+        .values(
+            crm_type = crm_type,
+            clinic_name = clinic_name,
+            clinic_number = clinic_number,
+            clinic_timezone = clinic_timezone,
+            od_developer_key = encrypt_secret(od_developer_key),
+            od_customer_key = encrypt_secret(od_customer_key),
+            crm_api_key = encrypt_secret(crm_api_key),
+            webhook_secret = encrypt_secret(raw_webhook_secret),
+            location_id = location_id,
+            calendar_id = encrypt_secret(calendar_id),
+            operatory_calendar_map = operatory_calendar_map,
+            owner_id = current_user.id,
         )
+        .on_conflict_do_nothing(
+            index_elements = ["owner_id", "clinic_name"],
+            index_where = RegisteredClinics.dso_id.is_(None),
+        )
+        .returning(RegisteredClinics)
+    )
+
     try:
-        db.add(clinic)
-        db.flush()
+        clinic = db.execute(stmt).scalars().first()
+        if clinic is None:
+            db.rollback()
+            log.warning("Duplicate clinic creation attempt", extra={
+                "user_id" : current_user.id,
+                "clinic_name" : payload.clinic_name,
+                "request_id ": request.state.request_id
+            },)
+            raise HTTPException(status_code = status.HTTP_400_BAD_REQUEST, detail = "You Already have a clinic created already")
 
         assignment = RoleAssignment(
             user_id=current_user.id,
@@ -73,9 +80,8 @@ async def standalone_clinic(payload : cliniccreate,  request: Request, db: Sessi
         )
         db.add(assignment)
         db.commit()
-        db.refresh(clinic)
 
-        log.info("Account has been successfully created", extra = { 
+        log.info("Account has been successfully created", extra = {
             "user_id" : current_user.id,
             "clinic_name" : clinic.clinic_name,
             "owner_id" : current_user.id,
@@ -163,7 +169,6 @@ async def dso_clinic(dso_id : UUID , payload:cliniccreate, request: Request, db:
         db.add(clinic_assignment)
 
         db.commit()
-        db.refresh(clinic)
         invalidate_dso_clinic_list_cache(dso_id=dso_id)
 
         log.info("Clinic  has been successfully created", extra ={ 
@@ -1,13 +1,15 @@
 from fastapi import Depends, APIRouter, HTTPException, status, Response
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from core.database import get_db
 from core.models import Users
 from sqlalchemy.orm import Session
 from auth.oauth2 import hashpassword
-from core.schemas import usercreate, userout
+from core.schemas import usercreate, userout, loginresponse, google_register_request
 from auth.session_helper import start_login_session
-from core.schemas import loginresponse, google_register_request
 from auth.google_auth import verify_google_credentials
 from sqlalchemy.exc import SQLAlchemyError
+from starlette.concurrency import run_in_threadpool
 import logging
 import secrets
 
@@ -20,21 +22,24 @@ router =  APIRouter(
 @router.post( "" , status_code= status.HTTP_201_CREATED, response_model= userout)
 async def registration (payload: usercreate, db :  Session = Depends(get_db)):
     email = payload.email.strip().lower()
-    existing = db.query(Users).filter(Users.email == email ).first()
-    if existing:
-        raise HTTPException(status.HTTP_400_BAD_REQUEST, detail = "User with this email already exist")
-    
-    hashed_pw = hashpassword(payload.password)
+    hashed_pw = await run_in_threadpool(hashpassword, payload.password)
 
-    user = Users(
-        username = payload.username,
-        email = email,
-        password = hashed_pw
+    stmt = (
+        pg_insert(Users)
+        .values(
+            username = payload.username,
+            email = email,
+            password = hashed_pw
+        )
+        .on_conflict_do_nothing(index_elements = [func.lower(Users.email)])
+        .returning(Users)
     )
-    db.add(user)
+    user = db.execute(stmt).scalars().first()
+    if user is None:
+        db.rollback()
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, detail = "User with this email already exist")
     db.commit()
-    db.refresh(user)
-    
+
     return user
 
 
@@ -66,7 +71,7 @@ async def register_with_google(
             detail = "Google account already registered. Use login with Google."
         )
     
-    existing_email = db.query(Users).filter(Users.email == google_user["email"]).first()
+    existing_email = db.query(Users).filter(func.lower(Users.email) == google_user["email"].lower()).first()
     if existing_email:
         logger.warning(
             "Google registration rejected: email already exists",
@@ -77,7 +82,7 @@ async def register_with_google(
             detail="Email already exists. Sign in normally ",
         )
     
-    unusable_password = hashpassword(secrets.token_urlsafe(48))
+    unusable_password = await run_in_threadpool(hashpassword, secrets.token_urlsafe(48))
 
     user = Users(
         username = username,
@@ -90,7 +95,6 @@ async def register_with_google(
     try:
         db.add(user)
         db.commit()
-        db.refresh(user)
     except SQLAlchemyError:
         db.rollback()
         logger.exception(
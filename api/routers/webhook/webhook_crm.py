@@ -1,13 +1,16 @@
+import asyncio
+import functools
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from uuid import UUID, uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from rq import Retry
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only
 
-from auth.security import encrypt_json_secret, encrypt_secret, hash_lookup
-from caches.dso_clinic_page_cache import invalidate_dso_clinic_list_cache
+from auth.security import encrypt_secret, hash_lookup
+from caches.dso_clinic_page_cache import schedule_dso_clinic_list_invalidation
 from core.database import get_db
 from core.models import RegisteredClinics, InboundEvent, SyncDirection
 from core.queue import async_redis, appointments_queue
@@ -24,6 +27,36 @@ router = APIRouter(
 )
 logger = logging.getLogger(__name__)
 
+# constant for the process lifetime; no need to rebuild it per webhook
+RETRY_CFG = Retry(
+    max=3,
+    interval=[60, 120, 300]
+)
+
+# dedicated pool for RQ enqueue so queue Redis I/O neither stalls the event
+# loop nor competes with the shared starlette threadpool (sync deps live there)
+_ENQUEUE_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="rq-enqueue")
+
+
+def _persist_event_state(
+    db: Session,
+    event: InboundEvent,
+    *,
+    processing_status: str,
+    failure_reason: str | None,
+    log_msg: str,
+    log_extra: dict,
+) -> None:
+    """Best-effort state update on the inbound event; a failed commit is
+    logged but never masks the outcome being recorded."""
+    event.processing_status = processing_status
+    event.failure_reason = failure_reason
+    try:
+        db.commit()
+    except SQLAlchemyError:
+        db.rollback()
+        logger.exception(log_msg, extra=log_extra)
+
 
 @router.post("/{crm_type}/{clinic_id}", status_code=202, response_model=webhook_response)
 async def webhooks(
@@ -33,10 +66,23 @@ async def webhooks(
     payload: Webhook_requests,
     db: Session = Depends(get_db),
 ):
-    logger.info(f"webhook received for clinic  {clinic_id}")
-    clinic = db.query(RegisteredClinics).filter_by(id=clinic_id).first()
+    logger.info("webhook received for clinic  %s", clinic_id)
+    clinic = (
+        db.query(RegisteredClinics)
+        .options(
+            load_only(
+                RegisteredClinics.crm_type,
+                RegisteredClinics.webhook_secret,
+                RegisteredClinics.dso_id,
+                RegisteredClinics.webhook_auth_failure_count,
+                RegisteredClinics.last_webhook_auth_failed_at,
+            )
+        )
+        .filter_by(id=clinic_id)
+        .first()
+    )
     if not clinic:
-        logger.warning(f"Webhook for invalid clinic_id={clinic_id} | crm={crm_type}")
+        logger.warning("Webhook for invalid clinic_id=%s | crm=%s", clinic_id, crm_type)
         raise HTTPException(status.HTTP_404_NOT_FOUND, detail="clinic not found wrong webhook url ")
 
     if clinic.crm_type.lower() != crm_type.lower():
@@ -74,7 +120,7 @@ async def webhooks(
                 detail="Unable to update webhook failure state",
             )
         if clinic.dso_id:
-            invalidate_dso_clinic_list_cache(dso_id=clinic.dso_id)
+            schedule_dso_clinic_list_invalidation(dso_id=clinic.dso_id)
 
         raise
 
@@ -100,21 +146,42 @@ async def webhooks(
     redis_key = f"webhook_processing:{event_id}:{hash_lookup(contact_id)}"
     claimed = await async_redis.set(redis_key, "processing", ex=300, nx=True)
     if not claimed:
-        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Duplicate Webhook")
+        logger.info(
+            "Duplicate webhook replay ignored",
+            extra={
+                "clinic_id": str(clinic.id),
+                "crm_type": crm_type,
+                "event_id": event_id,
+            },
+        )
+        existing = (
+            db.query(InboundEvent)
+            .filter_by(clinic_id=clinic.id, event_id=event_id)
+            .order_by(InboundEvent.received_at.desc())
+            .first()
+        )
+        return {
+            "status": status.HTTP_202_ACCEPTED,
+            "job_id": existing.job_id if existing and existing.job_id else "",
+            "message": "Duplicate webhook ignored",
+            "clinic": clinic_id,
+            "crm_type": crm_type,
+        }
 
     event = InboundEvent(
         clinic_id=clinic.id,
         crm_type=crm_type,
-        event_id=payload_dict.get("event_id"),
+        event_id=event_id,
         contact_id=encrypt_secret(contact_id),
-        payload=encrypt_json_secret(payload_dict),
+        # model_dump_json serializes straight from the model in Rust; going
+        # through json.dumps(payload_dict) would re-walk the dict in Python
+        payload=encrypt_secret(payload.model_dump_json()),
         processing_status="received",
     )
 
     try:
         db.add(event)
         db.commit()
-        db.refresh(event)
     except SQLAlchemyError:
         db.rollback()
         await async_redis.delete(redis_key)
@@ -132,7 +199,7 @@ async def webhooks(
         )
     
     if clinic.dso_id:
-        invalidate_dso_clinic_list_cache(dso_id=clinic.dso_id)
+        schedule_dso_clinic_list_invalidation(dso_id=clinic.dso_id)
 
     sync_log_service = AppointmentSyncLogService(db)
     sync_input = SyncLogInput(
@@ -156,20 +223,18 @@ async def webhooks(
         sync_log = sync_log_service.get_or_create_sync_log(sync_input)
     except Exception as exc:
         db.rollback()
-        event.processing_status = "failed"
-        event.failure_reason = str(exc)
-        try:
-            db.commit()
-        except SQLAlchemyError:
-            db.rollback()
-            logger.exception(
-                "Failed to persist sync log creation failure on inbound event",
-                extra={
-                    "clinic_id": str(clinic.id),
-                    "crm_type": crm_type,
-                    "event_id": event_id,
-                },
-            )
+        _persist_event_state(
+            db,
+            event,
+            processing_status="failed",
+            failure_reason=str(exc),
+            log_msg="Failed to persist sync log creation failure on inbound event",
+            log_extra={
+                "clinic_id": str(clinic.id),
+                "crm_type": crm_type,
+                "event_id": event_id,
+            },
+        )
         await async_redis.delete(redis_key)
         logger.exception(
             "Failed to create sync log for inbound webhook event",
@@ -184,10 +249,6 @@ async def webhooks(
             detail="Unable to create sync log",
         ) from exc
 
-    retry_cfg = Retry(
-        max=3,
-        interval=[60, 120, 300]
-    )
     job_id = str(uuid4())
 
     try:
@@ -212,53 +273,38 @@ async def webhooks(
         )
 
     try:
-        job = appointments_queue.enqueue(
-            process_crm_load_job,
-            clinic_id,
-            crm_type,
-            payload_dict,
-            sync_log.id,
-            job_id=job_id,
-            retry=retry_cfg,
+        # enqueue talks to Redis over the sync client; run it off the event
+        # loop so a slow Redis RTT doesn't stall other in-flight webhooks
+        job = await asyncio.get_running_loop().run_in_executor(
+            _ENQUEUE_EXECUTOR,
+            functools.partial(
+                appointments_queue.enqueue,
+                process_crm_load_job,
+                clinic_id,
+                crm_type,
+                payload_dict,
+                sync_log.id,
+                job_id=job_id,
+                retry=RETRY_CFG,
+            ),
         )
     except Exception as exc:
         await async_redis.delete(redis_key)
-        event.processing_status = "enqueue_failed"
-        event.failure_reason = str(exc)
-        try:
-            db.commit()
-        except SQLAlchemyError:
-            db.rollback()
-            logger.exception(
-                "Failed to persist enqueue failure state",
-                extra={
-                    "clinic_id": str(clinic.id),
-                    "crm_type": crm_type,
-                    "event_id": event_id,
-                    "job_id": job_id,
-                },
-            )
-        logger.exception(
-            "Failed to enqueue webhook job",
-            extra={
+        _persist_event_state(
+            db,
+            event,
+            processing_status="enqueue_failed",
+            failure_reason=str(exc),
+            log_msg="Failed to persist enqueue failure state",
+            log_extra={
                 "clinic_id": str(clinic.id),
                 "crm_type": crm_type,
                 "event_id": event_id,
                 "job_id": job_id,
             },
         )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Unable to queue webhook job",
-        ) from exc
-
-    try:
-        event.processing_status = "queued"
-        db.commit()
-    except SQLAlchemyError:
-        db.rollback()
         logger.exception(
-            "Webhook job queued but queued status could not be persisted",
+            "Failed to enqueue webhook job",
             extra={
                 "clinic_id": str(clinic.id),
                 "crm_type": crm_type,
@@ -266,6 +312,24 @@ async def webhooks(
                 "job_id": job_id,
             },
         )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Unable to queue webhook job",
+        ) from exc
+
+    _persist_event_state(
+        db,
+        event,
+        processing_status="queued",
+        failure_reason=None,
+        log_msg="Webhook job queued but queued status could not be persisted",
+        log_extra={
+            "clinic_id": str(clinic.id),
+            "crm_type": crm_type,
+            "event_id": event_id,
+            "job_id": job_id,
+        },
+    )
 
     return {
         "status": status.HTTP_202_ACCEPTED,
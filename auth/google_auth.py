@@ -10,11 +10,16 @@ logger = logging.getLogger(__name__)
 
 CLIENT_ID = settings.google_client_id
 
+# one transport for all verifications: reuses the underlying requests.Session
+# so Google's signing certs are fetched over a pooled connection instead of a
+# fresh session (and TLS handshake) per login
+_GOOGLE_REQUEST = google_requests.Request()
+
 def verify_google_credentials(credential: str) -> dict:
     try:
         idinfo= id_token.verify_oauth2_token(
             credential,
-            google_requests.Request(),
+            _GOOGLE_REQUEST,
             CLIENT_ID
         )
 
@@ -3,13 +3,14 @@ from core.queue import async_redis
 from  core.database import get_db
 from auth.google_auth import verify_google_credentials
 from auth.session_helper import start_login_session
-from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.orm import Session, load_only
 from core.models import Users
 from core.schemas import loginresponse, loginrequest, refreshresponse, google_login_request
-from auth.oauth2 import create_access_token, create_refresh_token ,  verify_password, validate_refresh_token, set_refresh_cookie, set_stream_access_cookie
-from auth.session_helper import start_login_session
+from auth.oauth2 import create_access_token, create_refresh_token ,  verify_password, validate_refresh_token, set_refresh_cookie, set_stream_access_cookie, pwd_context
+from starlette.concurrency import run_in_threadpool
 from auth.csrf_helper import verify_csrf, make_csrf_token, set_csrf_token
-from auth.login_helper import handle_failed_login, login_attempts, get_redis_attempts , MAX_LOGIN_ATTEMPTS, get_client_ip, clear_attempts_with_key
+from auth.login_helper import handle_failed_login, login_attempts, register_attempt_with_key , MAX_LOGIN_ATTEMPTS, get_client_ip, clear_attempts_with_key
 import logging
 import uuid
 
@@ -28,23 +29,35 @@ async def login(payload: loginrequest, request: Request, response: Response, db:
     ip = get_client_ip(request)
     key = await login_attempts(email, ip)
 
-    attempts = await get_redis_attempts(key)
-    if attempts >= MAX_LOGIN_ATTEMPTS:
+    attempts = await register_attempt_with_key(key)
+    if attempts > MAX_LOGIN_ATTEMPTS:
         raise HTTPException( status.HTTP_429_TOO_MANY_REQUESTS, detail = "Too many login attempt please Try again Later")
-    
-    user = db.query(Users).filter(Users.email == email).first()
-    if  user and  verify_password(password, hashed_password = user.password):
+
+    user = (
+        db.query(Users)
+        .options(load_only(Users.email, Users.password, Users.token_version, Users.is_active, Users.refresh_jti))
+        .filter(func.lower(Users.email) == email)
+        .first()
+    )
+    if user is None:
+        # burn the same hashing cost as a real verify so response timing
+        # doesn't leak whether the email exists
+        await run_in_threadpool(pwd_context.dummy_verify)
+        await handle_failed_login(attempts)
+
+    verified = await run_in_threadpool(verify_password, password, user.password)
+    if verified:
         if  not user.is_active:
             logger.warning(
             "Login rejected: account is deactivated",
             extra={"user_id": str(user.id), "email": user.email},
             )
             raise HTTPException(status_code=401, detail="Account is deactivated")
-    
+
         await clear_attempts_with_key(key)
         return start_login_session(user=user, response=response, db=db)
 
-    await handle_failed_login(key)
+    await handle_failed_login(attempts)
 
 
 
@@ -5,34 +5,34 @@ import logging
 
 logger = logging.getLogger(__name__)
 
-MAX_LOGIN_ATTEMPTS = 5 
-LOCK_WINDOWS_SECONDS = 30 * 60 
+MAX_LOGIN_ATTEMPTS = 5
+LOCK_WINDOWS_SECONDS = 30 * 60
+
+# One atomic INCR + first-hit EXPIRE instead of separate GET / INCR / EXPIRE
+# round-trips per login attempt.
+_INCR_ATTEMPT_LUA = """
+local n = redis.call('INCR', KEYS[1])
+if n == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return n
+"""
+_incr_attempt = async_redis.register_script(_INCR_ATTEMPT_LUA)
 
 async def login_attempts(email : str , ip: str ):
     return f"login attempts : {email} : {ip}"
 
-async def get_redis_attempts(key) -> int:
+async def register_attempt_with_key(key) -> int:
     try:
-        attempts_raw = await async_redis.get(key)
-        return int(attempts_raw) if attempts_raw is not None else 0
-    except RedisError:
-        logger.exception("Redis unavailable; login rate-limit read skipped", extra={"key": key})
-        return 0
-
-async def increment_attempts_with_key(key):
-    try:
-        attempts = await async_redis.incr(key)
-        if attempts >= MAX_LOGIN_ATTEMPTS:
-            await async_redis.expire(key, LOCK_WINDOWS_SECONDS)
+        attempts = await _incr_attempt(keys=[key], args=[LOCK_WINDOWS_SECONDS])
         return int(attempts)
     except RedisError:
-        logger.exception("Redis unavailable; login rate-limit read skipped", extra={"key": key})
+        logger.exception("Redis unavailable; login rate-limit skipped", extra={"key": key})
         return 0
 
 
-async def  handle_failed_login(key):
-    new_attempt = await increment_attempts_with_key(key)
-    if new_attempt >= MAX_LOGIN_ATTEMPTS:
+async def  handle_failed_login(attempts: int):
+    if attempts >= MAX_LOGIN_ATTEMPTS:
         raise HTTPException( status.HTTP_429_TOO_MANY_REQUESTS, detail= "Too many login attempt please Try again Later")
     raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail = "Invalid Email or Password ")
 
@@ -51,10 +51,4 @@ def get_client_ip(request: Request):
     if request.client is not None:
         return request.client.host
     return "unknown"
-    
-
-
-
-
-
 
@@ -2,9 +2,11 @@ from fastapi import APIRouter, Depends,Response, Cookie, Header, Request
 from auth.csrf_helper import verify_csrf
 from core.database import get_db
 from core.models import Users
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 from core.schemas import logoutresponse
 from auth.oauth2 import get_current_user, clear_stream_access_cookie
+from caches.user_cache import invalidate_current_user_cache
 
 
 router = APIRouter(
@@ -19,9 +21,13 @@ async def logout(
     db: Session = Depends(get_db),
   ):
  
-    current_user.token_version = int(current_user.token_version + 1)
-    current_user.refresh_jti = None
+    db.execute(
+        update(Users)
+        .where(Users.id == current_user.id)
+        .values(token_version=Users.token_version + 1, refresh_jti=None)
+    )
     db.commit()
+    invalidate_current_user_cache(user_id=current_user.id)
 
     response.delete_cookie(key="refresh_token", path="/login/refresh")
     response.delete_cookie(key="csrf_token", path="/") 
@@ -1,19 +1,22 @@
-from datetime import datetime, timedelta
+from datetime import timedelta
 from fastapi.security import OAuth2PasswordBearer
-from jose import jwt, JWTError
+import jwt
+from jwt import InvalidTokenError
 from passlib.context import CryptContext
 from config import settings
 from core.models import Users
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, make_transient_to_detached
 from fastapi import Depends, HTTPException, status, Response, Request
 from core.database import get_db
+from caches.user_cache import get_current_user_cached, set_current_user_cached
 import logging
+import time
 import uuid
 
 
 logger = logging.getLogger(__name__)
 
-pwd_context = CryptContext(schemes= ["bcrypt"], deprecated = "auto")
+pwd_context = CryptContext(schemes= ["argon2", "bcrypt"], deprecated = "auto")
 SECRET_KEY = settings.secret_key
 ACCESS_TOKEN_EXPIRE_MINUTES = settings.access_token_expire_minutes
 ALGORITHM = settings.algorithm
@@ -29,10 +32,10 @@ def verify_password(plain_password : str , hashed_password):
     return pwd_context.verify(plain_password, hashed_password)
 
 def create_token(*, data: dict, expires_delta : timedelta):
-    to_encode = data.copy()
-    expire = datetime.utcnow() + expires_delta
-    to_encode["exp"] = expire 
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm = ALGORITHM)
+    # callers pass a freshly-built dict, so mutate in place; an integer exp
+    # skips the datetime arithmetic and serializes smaller in the JWT
+    data["exp"] = int(time.time() + expires_delta.total_seconds())
+    encoded_jwt = jwt.encode(data, SECRET_KEY, algorithm = ALGORITHM)
     return encoded_jwt
 
 def create_access_token(*, user : Users):
@@ -57,9 +60,9 @@ def create_refresh_token(*, user: Users):
 def decode_token(token: str ):
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms= [ALGORITHM])
-        return payload 
-    except JWTError as e: 
-        raise ValueError("invalid Token") from e 
+        return payload
+    except InvalidTokenError as e:
+        raise ValueError("invalid Token") from e
 
 
 def parse_uuid(value: str) -> uuid.UUID:
@@ -68,35 +71,59 @@ def parse_uuid(value: str) -> uuid.UUID:
     except (ValueError, TypeError) as e:
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail="Invalid Token") from e
     
-def  get_current_user(token: str = Depends(oauth2_scheme), db:Session = Depends(get_db)): 
-    try:
-        payload = decode_token(token)
-    except ValueError as  e :
-        logger.warning(f"user provided invalid token{e}")
-        raise HTTPException(status.HTTP_401_UNAUTHORIZED , detail = "Invalid Token")
+def  get_current_user(token: str = Depends(oauth2_scheme), db:Session = Depends(get_db), request: Request = None):
+    payload = None
+    if request is not None and getattr(request.state, "jwt_token", None) == token:
+        payload = getattr(request.state, "jwt_payload", None)
+
+    if payload is None:
+        try:
+            payload = decode_token(token)
+        except ValueError as  e :
+            logger.warning("user provided invalid token%s", e)
+            raise HTTPException(status.HTTP_401_UNAUTHORIZED , detail = "Invalid Token")
 
     if payload.get("type")  !=  "access":
-        logger.warning(f"invalid token type for user:{payload.get('id')} ")
+        logger.warning("invalid token type for user:%s ", payload.get("id"))
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail = "invalid Token")
     
     user_id = payload.get("id")
     token_version = payload.get("token_version")
 
     if user_id is None or token_version is None:
-        logger.warning(f"invalid token type for user:{payload.get('id')} ")
+        logger.warning("invalid token type for user:%s ", payload.get("id"))
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail = "invalid Token")
     
     user_uuid = parse_uuid(user_id)
+
+    cached = get_current_user_cached(user_id=user_uuid)
+    if cached is not None and cached.get("token_version") == token_version:
+        if not cached.get("is_active"):
+            raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail="Account is deactivated")
+
+        user = Users(
+            id = user_uuid,
+            username = cached.get("username"),
+            email = cached.get("email"),
+            token_version = cached.get("token_version"),
+            is_active = True,
+        )
+        # merge(load=False) rejects transient instances; mark the rebuilt
+        # row detached (its pk is set) so it attaches without a SELECT
+        make_transient_to_detached(user)
+        return db.merge(user, load=False)
+
     user = db.query(Users).filter(Users.id == user_uuid).first()
     if not user:
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail = "Invalid Token")
-    
+
     if not user.is_active:
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail="Account is deactivated")
 
     if user.token_version != token_version:
          raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail = "Invalid Token")
-    
+
+    set_current_user_cached(user=user)
     return user
 
 
@@ -122,11 +149,11 @@ def validate_refresh_token(refresh_token: str , db: Session):
     try:
         payload = decode_token(refresh_token)
     except ValueError as e :
-        logger.warning(f"user provided invalid token{e}")
+        logger.warning("user provided invalid token%s", e)
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail= "Invalid Token")
     
     if payload.get("type") != "refresh":
-        logger.warning(f"invalid token type for user:{payload.get('id')} ")
+        logger.warning("invalid token type for user:%s ", payload.get("id"))
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail = "invalid Token")
     
     user_id = payload.get("id")
@@ -134,7 +161,7 @@ def validate_refresh_token(refresh_token: str , db: Session):
     incoming_jti = payload.get("jti")
 
     if user_id is None or token_version is None:
-        logger.warning(f"invalid token type for user:{payload.get('id')} ")
+        logger.warning("invalid token type for user:%s ", payload.get("id"))
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail = "invalid Token")
     
     user_uuid = parse_uuid(user_id)
@@ -1,24 +1,43 @@
+import base64
 import hashlib
 import hmac
 import json
+import os
+from functools import lru_cache
 
 from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from config import settings
 
 ENCRYPTION_KEY = settings.encryption_key
 fernet = Fernet(ENCRYPTION_KEY.encode() if isinstance(ENCRYPTION_KEY, str) else ENCRYPTION_KEY)
 HASH_KEY = (settings.hash_key or settings.encryption_key).encode("utf-8")
 
+# AES-GCM reuses the 32-byte Fernet key material; building the AESGCM object
+# once at import time means the AES key schedule runs once, not per call.
+aesgcm = AESGCM(base64.urlsafe_b64decode(ENCRYPTION_KEY.encode() if isinstance(ENCRYPTION_KEY, str) else ENCRYPTION_KEY))
+AESGCM_PREFIX = "g2:"
+AESGCM_NONCE_SIZE = 12
+
 def encrypt_secret(value: str | None) -> str | None:
     if value is None:
         return None
-    token = fernet.encrypt(value.encode("utf-8"))
-    return token.decode("utf-8")
+    nonce = os.urandom(AESGCM_NONCE_SIZE)
+    ciphertext = aesgcm.encrypt(nonce, value.encode("utf-8"), None)
+    return AESGCM_PREFIX + base64.urlsafe_b64encode(nonce + ciphertext).decode("utf-8")
 
 
+# ciphertexts are immutable once written, so identical inputs always decrypt
+# to the same plaintext; the LRU skips the AES/HMAC work on hot clinic configs
+@lru_cache(maxsize=4096)
 def decode_secret(value: str | None) -> str | None:
     if value is None:
         return None
+    if value.startswith(AESGCM_PREFIX):
+        raw = base64.urlsafe_b64decode(value[len(AESGCM_PREFIX):].encode("utf-8"))
+        nonce, ciphertext = raw[:AESGCM_NONCE_SIZE], raw[AESGCM_NONCE_SIZE:]
+        return aesgcm.decrypt(nonce, ciphertext, None).decode("utf-8")
+    # rows written before the AES-GCM switch are Fernet tokens
     token_byte = value.encode("utf-8")
     value_byte = fernet.decrypt(token_byte)
     return value_byte.decode ("utf-8")
@@ -39,6 +58,9 @@ def decode_json_secret(value: str | None):
     return json.loads(decoded)
 
 
+# same contact/event ids recur across the dedupe key, change key and patient
+# lookup within one webhook, so memoize like decode_secret above
+@lru_cache(maxsize=4096)
 def hash_lookup(value: str) -> str:
     return hmac.new(HASH_KEY, value.encode("utf-8"), hashlib.sha256).hexdigest()
 
@@ -1,6 +1,12 @@
-import json
+from caches.json_codec import dumps as _dumps, loads as _loads
 from uuid import UUID
-from core.queue import redis_client
+from core.queue import redis_client, async_redis
+import asyncio
+import functools
+import logging
+
+
+logger = logging.getLogger(__name__)
 
 
 DSO_CLINIC_LIST_TTL_SECONDS = 300
@@ -39,11 +45,11 @@ def cache_get_json(key: str)-> dict | None:
     else:
         return None
     
-    return json.loads(raw_text)
+    return _loads(raw_text)
 
 
 def cache_set_json(key:str, payload: dict, ttl_seconds:int):
-    redis_client.setex(key, ttl_seconds, json.dumps(payload))
+    redis_client.setex(key, ttl_seconds, _dumps(payload))
 
 
 def  invalidate_dso_clinic_list_cache(*, dso_id: UUID) -> None:
@@ -51,3 +57,39 @@ def  invalidate_dso_clinic_list_cache(*, dso_id: UUID) -> None:
 
     for key in redis_client.scan_iter(match=pattern):
         redis_client.delete(key)
+
+
+async def _invalidate_dso_clinic_list_cache_async(*, dso_id: UUID) -> None:
+    pattern = f"dso_clinics:list:dso:{dso_id}:*"
+
+    async for key in async_redis.scan_iter(match=pattern):
+        await async_redis.delete(key)
+
+
+# keep strong refs so fire-and-forget invalidations aren't GC'd mid-flight
+_pending_invalidation_tasks: set = set()
+
+
+def _on_invalidation_done(task: asyncio.Task, *, dso_id: UUID) -> None:
+    _pending_invalidation_tasks.discard(task)
+    if task.cancelled():
+        return
+    # retrieve the exception here so a Redis failure is logged immediately
+    # instead of surfacing as a never-retrieved warning at GC
+    exc = task.exception()
+    if exc is not None:
+        logger.warning(
+            "DSO clinic list invalidation failed for dso_id=%s; cached entries stay stale until TTL: %s",
+            dso_id,
+            exc,
+        )
+
+
+def schedule_dso_clinic_list_invalidation(*, dso_id: UUID) -> None:
+    """Kick off the SCAN+DEL in the background; webhook responses shouldn't
+    wait on a keyspace scan. Only safe on the long-lived server loop —
+    worker jobs run under asyncio.run, which cancels pending tasks on
+    shutdown, so worker paths call invalidate_dso_clinic_list_cache."""
+    task = asyncio.create_task(_invalidate_dso_clinic_list_cache_async(dso_id=dso_id))
+    _pending_invalidation_tasks.add(task)
+    task.add_done_callback(functools.partial(_on_invalidation_done, dso_id=dso_id))
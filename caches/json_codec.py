@@ -0,0 +1,15 @@
+import json
+
+try:
+    # C-accelerated and emits compact UTF-8 bytes directly; NON_STR_KEYS
+    # matches stdlib json, which stringifies non-string keys instead of
+    # raising
+    import orjson
+
+    def dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    loads = orjson.loads
+except ImportError:
+    dumps = json.dumps
+    loads = json.loads
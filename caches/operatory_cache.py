@@ -1,6 +1,6 @@
-import json
-from uuid import UUID 
+from uuid import UUID
 from core.queue import redis_client
+from caches.json_codec import dumps as _dumps, loads as _loads
 
 
 OPERATORY_APPOINTMENTS_TTL_SECONDS = 30
@@ -11,7 +11,7 @@ def operatory_day_cache_key(
         operatory: int,
         date_start: str,
         date_end: str
-) -> str: 
+) -> str:
     return(
         f"operatory_appts:"
         f"clinic:{clinic_id}"
@@ -20,6 +20,9 @@ def operatory_day_cache_key(
         f"to:{date_end}"
     )
 
+# sync client on purpose: the only callers run inside RQ jobs, where each
+# job's asyncio.run would strand an async pool on a dead loop; a 30s-TTL
+# GET/SETEX gains nothing from async anyway
 def get_operatory_day_appointments_cached(
         *,
         clinic_id: UUID,
@@ -27,7 +30,7 @@ def get_operatory_day_appointments_cached(
         date_start: str,
         date_end: str
 )->  list[dict] | None:
-    
+
     key = operatory_day_cache_key(
         clinic_id=clinic_id,
         operatory= operatory,
@@ -39,14 +42,8 @@ def get_operatory_day_appointments_cached(
     if not raw:
         return None
 
-    if isinstance(raw, (bytes, bytearray)):
-        raw_text = raw.decode("utf-8")
-    elif isinstance(raw, str):
-        raw_text = raw
-    else:
-        return None
-
-    return json.loads(raw_text)
+    # loads takes bytes or str directly; no intermediate decode copy
+    return _loads(raw)
 
 
 def set_operatory_day_appointments_cached(
@@ -63,7 +60,7 @@ def set_operatory_day_appointments_cached(
         date_start=date_start,
         date_end=date_end
 )
-    redis_client.setex(key, OPERATORY_APPOINTMENTS_TTL_SECONDS, json.dumps(appointments))
+    redis_client.setex(key, OPERATORY_APPOINTMENTS_TTL_SECONDS, _dumps(appointments))
 
 def invalidate_operatory_day_cache(
     *,
@@ -79,9 +76,3 @@ def invalidate_operatory_day_cache(
         date_end=date_end,
     )
     redis_client.delete(key)
-
-
-
-
-
-
@@ -1,4 +1,4 @@
-import json 
+from caches.json_codec import dumps as _dumps, loads as _loads
 from datetime import date, datetime, timezone
 from uuid import UUID
 from core.queue import redis_client
@@ -98,10 +98,10 @@ def cache_get_json(key: str)-> dict | None:
     else:
         return None
 
-    return json.loads(raw_text)
+    return _loads(raw_text)
 
 def cache_set_json(key: str, payload:dict, ttl_seconds:int)-> None:
-    redis_client.setex(key, ttl_seconds, json.dumps(payload))
+    redis_client.setex(key, ttl_seconds, _dumps(payload))
 
 
 def invalidate_hot_sync_log_cache(*, dso_id:UUID | None, clinic_id: UUID)-> None:
@@ -1,4 +1,4 @@
-import json
+from caches.json_codec import dumps as _dumps, loads as _loads
 from uuid import  UUID
 from core.queue import redis_client
 
@@ -15,7 +15,7 @@ def clinic_team_members_cache_key(*, clinic_id: UUID)-> str:
 
 
 def  cache_set_json(key: str, payload: dict, ttl_seconds: int)-> None:
-    redis_client.setex(key, ttl_seconds, json.dumps(payload))
+    redis_client.setex(key, ttl_seconds, _dumps(payload))
 
 
 def  cache_get_json(key: str)-> dict | None:
@@ -30,7 +30,7 @@ def  cache_get_json(key: str)-> dict | None:
     else:
         return None
 
-    return json.loads(raw_text)
+    return _loads(raw_text)
 
 def invalidate_dso_team_members_cache(*, dso_id: UUID) -> None:
     redis_client.delete(dso_team_members_cache_key(dso_id=dso_id))
@@ -0,0 +1,51 @@
+from caches.json_codec import dumps as _dumps, loads as _loads
+import logging
+from uuid import UUID
+
+from redis.exceptions import RedisError
+
+from core.queue import redis_client
+
+logger = logging.getLogger(__name__)
+
+CURRENT_USER_TTL_SECONDS = 300
+
+
+def current_user_cache_key(*, user_id: UUID) -> str:
+    return f"current_user:{user_id}"
+
+
+def get_current_user_cached(*, user_id: UUID) -> dict | None:
+    key = current_user_cache_key(user_id=user_id)
+    try:
+        raw = redis_client.get(key)
+    except RedisError:
+        logger.exception("Redis unavailable; current user cache read skipped", extra={"key": key})
+        return None
+
+    if not raw:
+        return None
+
+    return _loads(raw)
+
+
+def set_current_user_cached(*, user) -> None:
+    key = current_user_cache_key(user_id=user.id)
+    payload = {
+        "username": user.username,
+        "email": user.email,
+        "token_version": user.token_version,
+        "is_active": user.is_active,
+    }
+    try:
+        redis_client.setex(key, CURRENT_USER_TTL_SECONDS, _dumps(payload))
+    except RedisError:
+        logger.exception("Redis unavailable; current user cache write skipped", extra={"key": key})
+
+
+def invalidate_current_user_cache(*, user_id: UUID) -> None:
+    key = current_user_cache_key(user_id=user_id)
+    try:
+        redis_client.delete(key)
+    except RedisError:
+        logger.exception("Redis unavailable; current user cache invalidation skipped", extra={"key": key})
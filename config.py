@@ -1,5 +1,7 @@
+from dataclasses import dataclass
+
 from pydantic_settings import BaseSettings
-from pydantic import Field 
+from pydantic import Field
 
 class Settings (BaseSettings):
     database_username: str = Field(..., env=("database_username", "DATABASE_USERNAME"))  # type: ignore
@@ -10,14 +12,14 @@ class Settings (BaseSettings):
     secret_key :       str = Field(..., env = ("secret_key", "SECRET_KEY"))  # type: ignore
     algorithm :        str = Field(..., env = ("algorithm", "ALGORITHM"))  # type: ignore
     access_token_expire_minutes : int = Field(..., env = ("access_token_expire_minutes", "ACCESS_TOKEN_EXPIRE_MINUTES")) # type: ignore
-    refresh_token_expire_days :   int = Field(..., env = ("refresh_token_expire_days", "REFRESH_TOKEN_EXPIRE_DAYS")) # type: ignore  
+    refresh_token_expire_days :   int = Field(..., env = ("refresh_token_expire_days", "REFRESH_TOKEN_EXPIRE_DAYS")) # type: ignore
     encryption_key : str = Field(..., env = ("encryption_key",  "ENCRYPTION_KEY"))  # type: ignore
     hash_key: str | None = Field(default=None, env=("hash_key", "HASH_KEY"))  # type: ignore
     invite_ttl_hours: int = Field(..., env = ("invite_ttl_hours", "INVITE_TTL_HOURS")) # type: ignore
     redis_url: str = Field(..., env=("redis_url", "REDIS_URL"))  # type: ignore
     backend_base_url: str = Field(..., env=("backend_base_url", "BACKEND_BASE_URL"))  # type: ignore
     google_client_id: str = Field(..., env=("google_client_id", "GOOGLE_CLIENT_ID"))  # type: ignore
-    toroforge_network: str = Field(..., env= ("toroforge_network", "TOROFORGE_NETWORK")) # type: ignore 
+    toroforge_network: str = Field(..., env= ("toroforge_network", "TOROFORGE_NETWORK")) # type: ignore
     toroforge_base_url: str = Field(..., env= ("toroforge_base_url", "TOROFORGE_BASE_URL")) # type: ignore
     toroforge_connectw_url: str = Field(..., env=("toroforge_connectw_url", "TOROFORGE_CONNECTW_URL"))# type: ignore
     toroforge_payment_url: str = Field(default="https://www.toronet.org", env=("toroforge_payment_url", "TOROFORGE_PAYMENT_URL"))  # type: ignore
@@ -32,16 +34,33 @@ class Settings (BaseSettings):
         env_file_encoding = "utf-8"
 
 
-settings = Settings()  # type: ignore 
-
-
-
-
-
-
-
-
-
-
-
-
+# pydantic validates the env/.env values once at import; the frozen slots
+# dataclass snapshot is what the rest of the app reads, so hot paths like
+# create_token get a plain slot lookup instead of pydantic's descriptor chain
+@dataclass(frozen=True, slots=True)
+class FrozenSettings:
+    database_username: str
+    database_password: str
+    database_hostname: str
+    database_portname: str
+    database_name: str
+    secret_key: str
+    algorithm: str
+    access_token_expire_minutes: int
+    refresh_token_expire_days: int
+    encryption_key: str
+    hash_key: str | None
+    invite_ttl_hours: int
+    redis_url: str
+    backend_base_url: str
+    google_client_id: str
+    toroforge_network: str
+    toroforge_base_url: str
+    toroforge_connectw_url: str
+    toroforge_payment_url: str
+    toroforge_deployer_url: str
+    toroforge_admin: str
+    toroforge_adminpwd: str
+
+
+settings = FrozenSettings(**Settings().model_dump())  # type: ignore
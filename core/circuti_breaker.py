@@ -28,7 +28,9 @@ class CircuitBreaker:
     half_open_in_flight: int = field(default=0, init=False)
 
     def allow_request(self)-> bool:
-        now = time.time()
+        # monotonic: reset_timeout is an elapsed-time check and must not
+        # jump with wall-clock adjustments
+        now = time.monotonic()
 
         if self.state == CircuitBreakerState.CLOSED:
             return True
@@ -87,7 +89,7 @@ class CircuitBreaker:
         )
 
     def on_failure(self) -> None:
-        self.last_failure_time = time.time()
+        self.last_failure_time = time.monotonic()
 
         if self.state == CircuitBreakerState.HALF_OPEN:
             self.state = CircuitBreakerState.OPEN
@@ -1,16 +1,45 @@
 from sqlalchemy import create_engine, text
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.ext.asyncio import AsyncAttrs, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import DeclarativeBase, sessionmaker
 from config import settings
 
 
 SQLALCHEMY_DATABASE_URL = f'postgresql://{settings.database_username}:{settings.database_password}@{settings.database_hostname}:{settings.database_portname}/{settings.database_name}?sslmode=require'
+SQLALCHEMY_ASYNC_DATABASE_URL = f'postgresql+asyncpg://{settings.database_username}:{settings.database_password}@{settings.database_hostname}:{settings.database_portname}/{settings.database_name}?ssl=require'
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL, pool_pre_ping=True, pool_recycle= 1800)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-Base = declarative_base()
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    pool_size=25,
+    max_overflow=25,
+    pool_timeout=30,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    pool_use_lifo=True,
+    query_cache_size=1200,
+    insertmanyvalues_page_size=1000,
+)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
+
+class Base(AsyncAttrs, DeclarativeBase):
+    pass
+
+async_engine = create_async_engine(
+    SQLALCHEMY_ASYNC_DATABASE_URL,
+    pool_size=25,
+    max_overflow=25,
+    pool_timeout=30,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    query_cache_size=1200,
+    insertmanyvalues_page_size=1000,
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False, class_=AsyncSession)
+
+# plain per-request session: FastAPI runs sync dependency enter/exit on
+# arbitrary threadpool threads, so a thread-keyed scoped_session would leak
+# sessions and share one Session across concurrent requests
 def get_db():
     db = SessionLocal()
     try:
@@ -19,6 +48,11 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def ping_db() -> tuple[bool, str]:
     try:
         with engine.connect() as conn:
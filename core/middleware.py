@@ -1,4 +1,5 @@
 import logging
+import time
 from typing import Callable
 import uuid
 from fastapi import Request, Response, status
@@ -12,6 +13,27 @@ log = logging.getLogger(__name__)
 
 RATE_LIMIT_MAX_REQUESTS = 100
 RATE_LIMIT_WINDOW_SECONDS = 60
+RATE_LIMIT_REFILL_PER_SECOND = RATE_LIMIT_MAX_REQUESTS / RATE_LIMIT_WINDOW_SECONDS
+
+# token bucket: refills continuously instead of resetting on a fixed window,
+# so clients can't burst 2x the limit across a window boundary; one EVALSHA
+# round-trip returns {allowed, retry_after_seconds}
+_TOKEN_BUCKET_LUA = """
+local capacity = tonumber(ARGV[1])
+local refill = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local ttl_ms = tonumber(ARGV[4])
+local tokens = tonumber(redis.call('HGET', KEYS[1], 't')) or capacity
+local ts = tonumber(redis.call('HGET', KEYS[1], 'ts')) or now
+tokens = math.min(capacity, tokens + (now - ts) * refill)
+if tokens < 1 then
+    return {0, math.ceil((1 - tokens) / refill)}
+end
+redis.call('HSET', KEYS[1], 't', tokens - 1, 'ts', now)
+redis.call('PEXPIRE', KEYS[1], ttl_ms)
+return {1, 0}
+"""
+_take_token = async_redis.register_script(_TOKEN_BUCKET_LUA)
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request:Request, call_next: Callable,)-> Response: 
@@ -21,14 +43,19 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
     
         identifier = self._get_identifier(request)
         key = f"rl:{identifier}"
-        try: 
-            current_count: int = int(await async_redis.incr(key))
-            if current_count == 1 :
-                await async_redis.expire(key, RATE_LIMIT_WINDOW_SECONDS)
+        try:
+            allowed, retry_after = await _take_token(
+                keys=[key],
+                args=[
+                    RATE_LIMIT_MAX_REQUESTS,
+                    RATE_LIMIT_REFILL_PER_SECOND,
+                    time.time(),
+                    RATE_LIMIT_WINDOW_SECONDS * 2 * 1000,
+                ],
+            )
 
-            if current_count > RATE_LIMIT_MAX_REQUESTS:
-                ttl = await async_redis.ttl(key)
-                retry_after = ttl if ttl and ttl >  0 else RATE_LIMIT_WINDOW_SECONDS   #type: ignore[arg-type]
+            if not int(allowed):
+                retry_after = int(retry_after) if int(retry_after) > 0 else RATE_LIMIT_WINDOW_SECONDS
                 log.warning(f"Rate Limiting hit for this {identifier}, retry_after = {retry_after}",
                             request.method, request.url.path)
                 response =  JSONResponse(
@@ -78,7 +105,11 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             payload = decode_token(token)
         except Exception :
             return None
-        
+
+        # stash the decoded payload so get_current_user doesn't have to
+        # decode the very same token a second time
+        request.state.jwt_token = token
+        request.state.jwt_payload = payload
         return payload.get("id")
         
       
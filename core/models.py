@@ -1,25 +1,49 @@
-from sqlalchemy import Column, String, Integer, DateTime, Text, func, ForeignKey, UniqueConstraint, Date, BigInteger, Boolean, Enum, text
+from sqlalchemy import String, Integer, DateTime, Text, func, ForeignKey, UniqueConstraint, CheckConstraint, Date, BigInteger, Boolean, Enum, text
 from sqlalchemy.orm import relationship, Mapped, mapped_column
-from datetime import datetime, date
+# alias: Appointments has a column attribute named `date`, which would shadow
+# the bare import inside the class body and break its annotation
+from datetime import datetime, date as date_type
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy import Index
-from sqlalchemy.dialects.postgresql import JSON, UUID
+from sqlalchemy.dialects.postgresql import JSON, JSONB, UUID
 from typing import Any, Optional
 from core.database import Base
 from datetime import datetime
 import uuid
 import enum
+import os
+import time
+
+
+def uuid7() -> uuid.UUID:
+    # RFC 9562 UUIDv7: 48-bit unix-ms timestamp, then version/variant bits and
+    # 74 random bits. Time-ordered ids append to the right-most B-tree leaf
+    # instead of splitting random pages the way uuid4 inserts do.
+    ts_ms = time.time_ns() // 1_000_000
+    rand_a = int.from_bytes(os.urandom(2), "big") & 0x0FFF
+    rand_b = int.from_bytes(os.urandom(8), "big") & 0x3FFFFFFFFFFFFFFF
+    value = (
+        (ts_ms & 0xFFFFFFFFFFFF) << 80
+        | 0x7 << 76
+        | rand_a << 64
+        | 0b10 << 62
+        | rand_b
+    )
+    return uuid.UUID(int=value)
 
 
 class Autoid():
+    # fetch gen_random_uuid()/server_default timestamps in the INSERT's own
+    # RETURNING clause, so callers don't need a post-commit db.refresh SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
     @declared_attr
     def id(cls):
-        return Column(
+        return mapped_column(
             UUID(as_uuid=True),
             primary_key=True,
+            default=uuid7,
             server_default=text("gen_random_uuid()"),
-            index=True,
-            unique=True,
             nullable=False,
         )
 
@@ -180,9 +204,9 @@ class PaymentTransactionStatus(str, enum.Enum):
 
 class Users(Base, Autoid):
     __tablename__ = "users"
-    username = Column(String, nullable=False)
-    email = Column(String, nullable=False, unique=True)
-    password = Column(String, nullable=False)
+    username: Mapped[str] = mapped_column(String, nullable=False)
+    email: Mapped[str] = mapped_column(String, nullable=False)
+    password: Mapped[str] = mapped_column(String, nullable=False)
     google_sub: Mapped[Optional[str]] = mapped_column(String, nullable=True, unique=True, index=True)
     auth_provider: Mapped[str] = mapped_column(String, nullable=False, default="local", server_default="local")
     token_version: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
@@ -199,9 +223,15 @@ class Users(Base, Autoid):
         DateTime(timezone=True),
         nullable=True,
     )
-    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
-    clinics = relationship("RegisteredClinics", back_populates="owner",foreign_keys="RegisteredClinics.owner_id", cascade="all, delete")
-    dsos = relationship("Dso", back_populates="user", cascade="all, delete")
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    clinics = relationship("RegisteredClinics", back_populates="owner",foreign_keys="RegisteredClinics.owner_id", cascade="all, delete", lazy="raise_on_sql")
+    dsos = relationship("Dso", back_populates="user", cascade="save-update, merge", passive_deletes=True, lazy="raise_on_sql")
+
+    __table_args__ = (
+        # case-insensitive uniqueness: the local signup path lowercases input
+        # but the Google path stores the address as issued
+        Index("uq_users_email_lower", text("lower(email)"), unique=True),
+    )
 
 
 class Dso(Base, Autoid):
@@ -209,7 +239,7 @@ class Dso(Base, Autoid):
     name: Mapped[str] = mapped_column(String, nullable=False)
     user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
-    clinics = relationship("RegisteredClinics", back_populates="dso", cascade="all, delete")
+    clinics = relationship("RegisteredClinics", back_populates="dso", cascade="save-update, merge", passive_deletes=True, lazy="selectin")
     user = relationship("Users", back_populates="dsos")
 
     __table_args__ = (
@@ -221,15 +251,17 @@ class RegisteredClinics(Base, Autoid):
     __tablename__ = "registered_clinics"
     crm_type: Mapped[str] = mapped_column(String, nullable=False)
     clinic_name: Mapped[str] = mapped_column(String, nullable=False)
-    clinic_number: Mapped[int] = mapped_column(Integer, nullable=False)
+    clinic_number: Mapped[int] = mapped_column(BigInteger, nullable=False)
     clinic_timezone: Mapped[str] = mapped_column(String, nullable=False)
-    od_developer_key: Mapped[str] = mapped_column(String, nullable=False)
-    od_customer_key: Mapped[str] = mapped_column(String, nullable=False)
-    crm_api_key: Mapped[str] = mapped_column(String, nullable=False)
+    # encrypted integration keys are only read by the sync worker and the
+    # health check; keep them out of the default projection
+    od_developer_key: Mapped[str] = mapped_column(String, nullable=False, deferred=True, deferred_group="secrets")
+    od_customer_key: Mapped[str] = mapped_column(String, nullable=False, deferred=True, deferred_group="secrets")
+    crm_api_key: Mapped[str] = mapped_column(String, nullable=False, deferred=True, deferred_group="secrets")
     webhook_secret: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     location_id: Mapped[str] = mapped_column(String, nullable=False)
     calendar_id: Mapped[str] = mapped_column(String, nullable=False)
-    operatory_calendar_map: Mapped[Optional[dict[str, list[dict[str, Any]]]]] = mapped_column(JSON, nullable=True)
+    operatory_calendar_map: Mapped[Optional[dict[str, list[dict[str, Any]]]]] = mapped_column(JSONB, nullable=True)
     owner_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="RESTRICT"), nullable=False)
     dso_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("Dsos.id", ondelete="CASCADE"), nullable=True, index=True)
     last_webhook_auth_failed_at: Mapped[Optional[datetime]] = mapped_column(
@@ -247,54 +279,92 @@ class RegisteredClinics(Base, Autoid):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
     dso = relationship("Dso", back_populates="clinics")
     owner = relationship("Users", back_populates="clinics", foreign_keys=[owner_id])
-    patients = relationship("Patients", back_populates="clinic", cascade="all, delete")
-    appointments = relationship("Appointments", back_populates="clinic", cascade="all, delete")
+    patients = relationship("Patients", back_populates="clinic", cascade="save-update, merge", passive_deletes=True, lazy="raise_on_sql")
+    appointments = relationship("Appointments", back_populates="clinic", cascade="save-update, merge", passive_deletes=True, lazy="raise_on_sql")
+
+    __table_args__ = (
+        Index(
+            "uq_clinics_owner_name_standalone",
+            "owner_id",
+            "clinic_name",
+            unique=True,
+            postgresql_where=text("dso_id IS NULL"),
+        ),
+        Index(
+            "ix_registered_clinics_dso_clinic_number",
+            "dso_id",
+            "clinic_number",
+        ),
+    )
 
 
 
 class Patients(Base, Autoid):
     __tablename__ = "patients"
-    FName = Column(String, nullable=True)
-    LName = Column(String, nullable=True)
-    Gender = Column(String, nullable=False)
-    phone = Column(String, nullable=False)
-    email = Column(String, nullable=True)
-    pat_num: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
-    contact_id = Column(String, nullable=False)
-    contact_id_hash = Column(String, nullable=True, index=True)
-    clinic_id = Column(UUID(as_uuid=True), ForeignKey("registered_clinics.id", ondelete="CASCADE"), nullable=False)
-    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    FName: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    LName: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    Gender: Mapped[str] = mapped_column(String, nullable=False)
+    phone: Mapped[str] = mapped_column(String, nullable=False)
+    email: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    pat_num: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+    contact_id: Mapped[str] = mapped_column(String, nullable=False)
+    contact_id_hash: Mapped[Optional[str]] = mapped_column(String, nullable=True, index=True)
+    clinic_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("registered_clinics.id", ondelete="CASCADE"), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
     clinic = relationship("RegisteredClinics", back_populates="patients")
-    appointments = relationship("Appointments", back_populates="patient", cascade="all, delete")
+    appointments = relationship("Appointments", back_populates="patient", cascade="save-update, merge", passive_deletes=True, lazy="raise_on_sql")
 
     __table_args__ = (
         UniqueConstraint("clinic_id", "pat_num", name="uq_clinic_patnum"),
         UniqueConstraint("clinic_id", "contact_id_hash", name="uq_clinic_contactid_hash"),
+        Index("ix_patients_clinic_phone", "clinic_id", "phone"),
     )
 
 
 class Appointments(Base, Autoid):
     __tablename__ = "appointments"
-    AptNum: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    AptNum: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
     event_id: Mapped[str] = mapped_column(String, nullable=False)
     status: Mapped[str] = mapped_column(String, nullable=False)
     previous_status: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     status_changed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
-    start_time: Mapped[str] = mapped_column(String, nullable=False)
-    end_time: Mapped[str] = mapped_column(String, nullable=False)
-    date: Mapped[str] = mapped_column(String, nullable=False)
+    # clinic-local wall times (the OD API speaks clinic-local, no offset),
+    # so these stay timezone-naive on purpose
+    start_time: Mapped[datetime] = mapped_column(DateTime(), nullable=False)
+    end_time: Mapped[datetime] = mapped_column(DateTime(), nullable=False)
+    date: Mapped[date_type] = mapped_column(Date, nullable=False)
     calendar_id: Mapped[str] = mapped_column(String, nullable=False)
     commslog_done: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default="false")
     popups_done: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default="false")
     clinic_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("registered_clinics.id", ondelete="CASCADE"), nullable=False)
     pat_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("patients.id", ondelete="CASCADE"), nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
-    clinic = relationship("RegisteredClinics", back_populates="appointments", cascade="all, delete")
-    patient = relationship("Patients", back_populates="appointments", cascade="all, delete")
+    clinic = relationship("RegisteredClinics", back_populates="appointments")
+    patient = relationship("Patients", back_populates="appointments")
 
     __table_args__ = (
         UniqueConstraint("clinic_id", "AptNum", name="uq_clinic_AptNum"),
         UniqueConstraint("clinic_id", "event_id", name="uq_clinic_eventid"),
+        CheckConstraint("end_time > start_time", name="ck_appointments_end_after_start"),
+        # INCLUDE carries the listing columns in the leaf pages so per-clinic
+        # schedule reads can be index-only scans instead of heap fetches
+        Index(
+            "ix_appt_clinic_start",
+            "clinic_id",
+            "start_time",
+            postgresql_include=["event_id", "status", "pat_id"],
+        ),
+        # upcoming-appointment scans only care about live rows; terminal
+        # statuses are excluded so the index stays small as history grows
+        Index(
+            "ix_appt_active",
+            "clinic_id",
+            "start_time",
+            postgresql_where=text("status NOT IN ('cancelled', 'canceled', 'completed')"),
+        ),
+        # uuid7 PKs make inserts roughly time-ordered, so a BRIN over
+        # start_time stays a few pages while covering whole-table time ranges
+        Index("ix_appt_start_brin", "start_time", postgresql_using="brin"),
     )
 
 
@@ -325,27 +395,27 @@ class InboundEvent(Base, Autoid):
 
 class Audit_logs(Base, Autoid):
     __tablename__ = "audit_logs"
-    clinic_id = Column(UUID(as_uuid=True), nullable=False)
-    entity_type = Column(String, nullable=False)
-    entity_id = Column(String, nullable=True)
-    action = Column(String, nullable=False)
-    status = Column(String, nullable=False)
-    source = Column(String, nullable=False)
-    details = Column(JSON, nullable=True)
-    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    clinic_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    entity_type: Mapped[str] = mapped_column(String, nullable=False)
+    entity_id: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    action: Mapped[str] = mapped_column(String, nullable=False)
+    status: Mapped[str] = mapped_column(String, nullable=False)
+    source: Mapped[str] = mapped_column(String, nullable=False)
+    details: Mapped[Optional[dict[str, Any]]] = mapped_column(JSON, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
 
 class RoleAssignment(Base, Autoid):
     __tablename__ = "role_assignments"
 
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     scope_type: Mapped[ScopeType] = mapped_column(Enum(ScopeType, name="scope_type_enum"), nullable=False)
     role: Mapped[RoleType] = mapped_column(Enum(RoleType, name="role_type_enum"), nullable=False)
-    dso_id = Column(UUID(as_uuid=True), ForeignKey("Dsos.id", ondelete="CASCADE"), nullable=True)
-    clinic_id = Column(UUID(as_uuid=True), ForeignKey("registered_clinics.id", ondelete="CASCADE"), nullable=True)
+    dso_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("Dsos.id", ondelete="CASCADE"), nullable=True)
+    clinic_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("registered_clinics.id", ondelete="CASCADE"), nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True, server_default="true")
-    created_by = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
-    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    created_by: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
     __table_args__ = (
         Index(
@@ -368,17 +438,17 @@ class RoleAssignment(Base, Autoid):
 class MemberInvite(Base, Autoid):
     __tablename__ = "member_invites"
 
-    email = Column(String, nullable=False)
-    token_hash = Column(String, nullable=False, unique=True)
+    email: Mapped[str] = mapped_column(String, nullable=False)
+    token_hash: Mapped[str] = mapped_column(String, nullable=False, unique=True)
     scope_type: Mapped[ScopeType] = mapped_column(Enum(ScopeType, name="scope_type_enum"), nullable=False)
     role: Mapped[RoleType] = mapped_column(Enum(RoleType, name="role_type_enum"), nullable=False)
-    dso_id = Column(UUID(as_uuid=True), ForeignKey("Dsos.id", ondelete="CASCADE"), nullable=True)
-    clinic_id = Column(UUID(as_uuid=True), ForeignKey("registered_clinics.id", ondelete="CASCADE"), nullable=True)
-    created_by = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
-    expires_at = Column(DateTime(timezone=True), nullable=False)
+    dso_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("Dsos.id", ondelete="CASCADE"), nullable=True)
+    clinic_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("registered_clinics.id", ondelete="CASCADE"), nullable=True)
+    created_by: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     accepted_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     revoked_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
-    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
 
 
@@ -395,7 +465,7 @@ class AppointmentSyncLog(Base, Autoid):
     change_key: Mapped[str] = mapped_column(String, nullable=False)
     event_id: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     contact_id: Mapped[Optional[str]] = mapped_column(String, nullable=True)
-    apt_num: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    apt_num: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
     patient_name: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     patient_name_search: Mapped[Optional[str]] = mapped_column(String, nullable=True, index=True,)
     reason: Mapped[Optional[str]] = mapped_column(String, nullable=True)
@@ -651,7 +721,7 @@ class DailySyncUsageSummary(Base, Autoid):
 
     clinic_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("registered_clinics.id", ondelete="CASCADE"), nullable=False, index=True)
 
-    usage_date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    usage_date: Mapped[date_type] = mapped_column(Date, nullable=False, index=True)
 
     total_sync_attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
 
@@ -697,7 +767,7 @@ class WalletLedgerEntry(Base, Autoid):
 
     counterparty_wallet_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True),ForeignKey("wallets.id", ondelete="SET NULL"), nullable=True,index=True)
 
-    transaction_group_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False,default=uuid.uuid4, index=True)
+    transaction_group_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False,default=uuid7, index=True)
 
     entry_type: Mapped[LedgerEntryType] = mapped_column(Enum(LedgerEntryType, name="ledger_entry_type_enum"), nullable=False, index=True)
 
@@ -1,6 +1,7 @@
 from core.schemas import patient_model, Appointments_create, Appointments_update, create_commslogs,  create_pop_ups, create_contact_ghl, create_appointment_ghl, update_appointment_ghl
 from core.database import SessionLocal
 from dateutil import parser
+from functools import lru_cache
 from core.models import Appointments, RegisteredClinics
 import pytz
 import logging
@@ -13,13 +14,17 @@ from typing import Any, cast
 fmt = "%Y-%m-%d %H:%M:%S "
 logger = logging.getLogger(__name__)
 
+# clinics reuse a handful of timezone names; skip pytz's lookup machinery
+# after the first resolution
+_get_timezone = lru_cache(maxsize=128)(pytz.timezone)
+
 async def retry_with_bak_off ( func, retries: int = 5, base_delay : int = 1 , retry_on : tuple = (httpx.HTTPStatusError, httpx.RequestError)):
     delay = base_delay
     for attempt in range(retries):
         try:
             return await func()
         except retry_on as e:
-            logger.warning(f"Retry {attempt + 1} failed due to request error: {e}. Waiting {delay}s")
+            logger.warning("Retry %s failed due to request error: %s. Waiting %ss", attempt + 1, e, delay)
             await asyncio.sleep(delay)
             delay *= 2
 
@@ -72,15 +77,14 @@ async def opendental_pattern_time_build(
     end_time: str,
     clinic_timezone: str,
 ) -> tuple[datetime, datetime, str]:
-    #comibinig date and time 
-    start_raw = f"{date_str}:{start_time}"
-    end_raw = f"{date_str}:{end_time}"
+    #parse the date once and let it default both time strings
+    base_date = parser.parse(date_str)
 
-    start_dt = parser.parse(start_raw)
-    end_dt = parser.parse(end_raw)
+    start_dt = parser.parse(start_time, default=base_date)
+    end_dt = parser.parse(end_time, default=base_date)
 
     #localize 
-    tz = pytz.timezone(clinic_timezone)
+    tz = _get_timezone(clinic_timezone)
     start_dt = tz.localize(start_dt)
     end_dt = tz.localize(end_dt)
 
@@ -119,14 +123,17 @@ def get_pattern_from_od(start_time_str: str, pattern: str) -> datetime:
     return endtime    
 
 
-async def check_time_slot(
+def check_time_slot(
     existing_appt: list[dict[str, Any]],
     new_start_time: datetime,
     new_end_time: datetime,
 ) -> bool:
+    # pure CPU scan over a same-day list; no reason to pay coroutine
+    # scheduling per operatory
     for appt in existing_appt:
+        # parse AptDateTime once; the end is just start + pattern length
         starttime = datetime.strptime(appt["AptDateTime"], fmt)
-        endtime = get_pattern_from_od(start_time_str= appt["AptDateTime"], pattern = appt["Pattern"])
+        endtime = starttime + timedelta(minutes = len(appt["Pattern"]) * 5)
 
         if (new_start_time < endtime) and (new_end_time > starttime):
             return False 
@@ -1,10 +1,13 @@
 from sdk.opendental_sdk import openDentalApi, OpenDentalAuthError
 from  sqlalchemy.orm  import Session
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from core.models import Appointments, RegisteredClinics, AppointmentSyncLog
 from core.schemas import AppointmentRequest, Appointments_create, Appointments_update, create_commslogs, create_pop_ups
 from datetime import datetime, timezone
-from caches.operatory_cache import (get_operatory_day_appointments_cached, set_operatory_day_appointments_cached, invalidate_operatory_day_cache)
+from caches.operatory_cache import (get_operatory_day_appointments_cached, set_operatory_day_appointments_cached, invalidate_operatory_day_cache, operatory_day_cache_key)
+# worker loops exit via asyncio.run, which cancels pending tasks, so use
+# the synchronous invalidation here rather than the fire-and-forget form
 from caches.dso_clinic_page_cache import invalidate_dso_clinic_list_cache
 from infra.appointment_sync_log_helper import AppointmentSyncLogService
 from infra.clinic_health import mark_od_auth_failed, mark_od_health_ok
@@ -16,6 +19,11 @@ from core.utils import check_time_slot, fmt, opendental_get_operatory_status, op
 
 logger = logging.getLogger(__name__)
 
+# singleflight: one in-flight OpenDental fetch per operatory/day key, so a
+# burst of cache misses in this process awaits the same call instead of each
+# hitting OpenDental
+_operatory_fetch_inflight: dict[str, asyncio.Future] = {}
+
 
 class CustomerConfigurationSyncError(Exception):
     pass
@@ -134,44 +142,64 @@ class AppointmentService():
             )
         
         if cached is not None:
-            return cached 
-        
-        appointments = await self._run_od_call(
-            await self.od.get_appointments_in_operatory(
-                operatory,
-                date_start,
-                date_end,
-            ), 
-            operation= "get_operatory_appointments"
-        )
+            return cached
 
-
-        set_operatory_day_appointments_cached(
+        key = operatory_day_cache_key(
             clinic_id=self.clinic.id,
             operatory=operatory,
             date_start=date_start,
             date_end=date_end,
-            appointments=appointments,
         )
-        return appointments
+
+        inflight = _operatory_fetch_inflight.get(key)
+        if inflight is not None:
+            return await inflight
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        _operatory_fetch_inflight[key] = future
+
+        try:
+            appointments = await self._run_od_call(
+                await self.od.get_appointments_in_operatory(
+                    operatory,
+                    date_start,
+                    date_end,
+                ),
+                operation= "get_operatory_appointments"
+            )
+
+
+            set_operatory_day_appointments_cached(
+                clinic_id=self.clinic.id,
+                operatory=operatory,
+                date_start=date_start,
+                date_end=date_end,
+                appointments=appointments,
+            )
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # mark retrieved so lone failures don't warn
+            raise
+        else:
+            future.set_result(appointments)
+            return appointments
+        finally:
+            _operatory_fetch_inflight.pop(key, None)
         
 
 
     async def book(self, req: AppointmentRequest, * , sync_log_service: AppointmentSyncLogService | None = None,
         sync_log: AppointmentSyncLog | None = None,) -> AppointmentBookingResult | None:
         start_dt, end_dt , pattern = await self.build_time(req)
-        start_text = self._format_od_datetime(start_dt)
-        end_text = self._format_od_datetime(end_dt)
-
-        reserve = await self.book_reserve(req, start_text=start_text, end_text=end_text)
+        reserve = await self.book_reserve(req, start_dt=start_dt, end_dt=end_dt)
         existing_aptnum = reserve.AptNum if (reserve and reserve.AptNum ) else None 
 
         if reserve and existing_aptnum:
             change = bool(
             reserve.status != req.status
-            or reserve.date != req.date_str
-            or reserve.start_time != start_text
-            or reserve.end_time != end_text
+            or reserve.date != start_dt.date()
+            or reserve.start_time != start_dt
+            or reserve.end_time != end_dt
             )
 
             if not change:
@@ -198,25 +226,38 @@ class AppointmentService():
             logger.warning("No timeslot available for this Appointment in any operatory")
             return None 
         
-        logger.info(f"Appointment is being booked for {booking.apt_num} in {operatories} for clinic {self.clinic.clinic_name}")
+        logger.info("Appointment is being booked for %s in %s for clinic %s", booking.apt_num, operatories, self.clinic.clinic_name)
         if reserve:
             reserve.AptNum = booking.apt_num
             self._apply_status_transition(reserve, req.status)
-            reserve.date = req.date_str   # type: ignore
-            reserve.start_time = start_text   # type: ignore
-            reserve.end_time = end_text    # type: ignore
+            reserve.date = start_dt.date()
+            reserve.start_time = start_dt
+            reserve.end_time = end_dt
             self.db.commit()
 
         
-        if reserve and not reserve.commslog_done and req.commslog:   # type: ignore
-            logger.info(f"commslog is being created for Aptnum {booking.apt_num} ")
-            await self.handle_commslog(req)
-            reserve.commslog_done = True
-            self.db.commit()
-
-        if  reserve and not reserve.popups_done and req.pop_up:   # type: ignore
-            logger.info(f"popups is being created for Aptnum {booking.apt_num} ")
-            await self.handle_popups(req)
+        # commslog and popup creation are independent OpenDental calls, so
+        # fire them together instead of paying two sequential round-trips
+        pending = []
+        do_commslog = bool(reserve and not reserve.commslog_done and req.commslog)   # type: ignore
+        do_popups = bool(reserve and not reserve.popups_done and req.pop_up)   # type: ignore
+
+        if do_commslog:
+            logger.info("commslog is being created for Aptnum %s ", booking.apt_num)
+            pending.append(self.handle_commslog(req))
+
+        if do_popups:
+            logger.info("popups is being created for Aptnum %s ", booking.apt_num)
+            pending.append(self.handle_popups(req))
+
+        if pending:
+            results = await asyncio.gather(*pending, return_exceptions=True)
+            if do_commslog and not isinstance(results[0], BaseException):
+                reserve.commslog_done = True
+                self.db.commit()
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
 
         return booking
 
@@ -247,11 +288,11 @@ class AppointmentService():
 
 
         for op, existing in zip(operatories, results):
-            if not await check_time_slot(existing, start_dt, end_dt):
+            if not check_time_slot(existing, start_dt, end_dt):
                 continue
 
             if AptNum: 
-                logger.info(f"Updated Appointment for Aptnum {AptNum} in  Op  {op}")
+                logger.info("Updated Appointment for Aptnum %s in  Op  %s", AptNum, op)
                 await self.update_appointment( 
                     pattern = pattern, 
                     req = req ,
@@ -269,7 +310,7 @@ class AppointmentService():
                 
                 return AppointmentBookingResult(apt_num = int(AptNum), action = "updated")
             
-            logger.info(f"creating  Appointment for Aptnum {AptNum} in  Op  {op}")
+            logger.info("creating  Appointment for Aptnum %s in  Op  %s", AptNum, op)
             created = await self.create_appointment(
                     pattern = pattern,
                     op = op,
@@ -297,7 +338,7 @@ class AppointmentService():
     
 
 
-    async def book_reserve(self, req: AppointmentRequest, start_text: str, end_text: str) -> Appointments | None:
+    async def book_reserve(self, req: AppointmentRequest, start_dt: datetime, end_dt: datetime) -> Appointments | None:
         if  not req.event_id:
             return None 
 
@@ -305,39 +346,44 @@ class AppointmentService():
         if row:
             return row 
         
-        row = Appointments(
-        clinic_id=self.clinic.id,
-        event_id=req.event_id,
-        status=req.status,
-        previous_status=None,
-        status_changed_at=self._utcnow(),
-        start_time=start_text,
-        end_time=end_text,
-        date=req.date_str,
-        calendar_id=req.calendar_id,
-        pat_id=req.pat_id,          
-        AptNum=None,               
-         )
-        
+        stmt = (
+            pg_insert(Appointments)
+            .values(
+                clinic_id=self.clinic.id,
+                event_id=req.event_id,
+                status=req.status,
+                previous_status=None,
+                status_changed_at=self._utcnow(),
+                start_time=start_dt,
+                end_time=end_dt,
+                date=start_dt.date(),
+                calendar_id=req.calendar_id,
+                pat_id=req.pat_id,
+                AptNum=None,
+            )
+            .on_conflict_do_nothing(index_elements=["clinic_id", "event_id"])
+            .returning(Appointments)
+        )
+
         try:
-            self.db.add(row)
+            row = self.db.execute(stmt).scalars().first()
             self.db.commit()
-            self.db.refresh(row)
-            return row 
-        
-        except IntegrityError:
-            self.db.rollback()
-            return (
-            self.db.query(Appointments)
-            .filter_by(clinic_id=self.clinic.id, event_id=req.event_id)
-            .first()
-        )
 
         except SQLAlchemyError:
         # Anything else is a real DB issue — stop
             self.db.rollback()
             raise
 
+        if row is not None:
+            return row
+
+        # lost the insert race to a concurrent worker
+        return (
+            self.db.query(Appointments)
+            .filter_by(clinic_id=self.clinic.id, event_id=req.event_id)
+            .first()
+        )
+
     async def create_appointment(
         self,
         req: AppointmentRequest,
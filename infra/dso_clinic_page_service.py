@@ -6,7 +6,7 @@ from auth.security import decode_secret
 from fastapi import HTTPException, status
 from sqlalchemy import String, cast, func, or_
 from sqlalchemy.exc import  SQLAlchemyError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer_group
 from core.models import AppointmentSyncLog, RegisteredClinics, SyncStatus, RoleAssignment, ScopeType, RoleType
 from core.schemas import dso_clinic_actions_out, dso_clinic_disabled_out, dso_clinic_summary_Out, dso_clinic_list_out, dso_clinic_row_out
 from caches.dso_clinic_page_cache import DSO_CLINIC_LIST_TTL_SECONDS, cache_get_json,cache_set_json, dso_clinic_list_cache_Key, invalidate_dso_clinic_list_cache
@@ -168,7 +168,9 @@ def build_dso_clinic_list(
 
     start_dt, end_dt = today_window()
 
-    query = db.query(RegisteredClinics).filter(RegisteredClinics.dso_id ==dso_id)
+    # the health check inspects the encrypted keys, so undefer them here in
+    # one batch rather than lazy-loading per clinic row
+    query = db.query(RegisteredClinics).options(undefer_group("secrets")).filter(RegisteredClinics.dso_id ==dso_id)
 
     if search:
         pattern = f"%{search.strip()}%"
@@ -1,6 +1,7 @@
 from sdk.opendental_sdk import openDentalApi
 from core.models import Patients
 from core.schemas import patient_model
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from auth.security import encrypt_secret, fingerprint_value, hash_lookup
 import logging
@@ -20,32 +21,40 @@ class PatientService():
         if row:
             return row 
         
-        row = Patients(
-            contact_id = encrypt_secret(contact_id),
-            contact_id_hash=contact_hash,
-            FName = encrypt_secret(pat.FName) if pat.FName else None,
-            LName = encrypt_secret(pat.LName) if pat.LName else None,
-            Gender = pat.Gender,
-            phone = encrypt_secret(pat.WirelessPhone) if pat.WirelessPhone else "",
-            email = encrypt_secret(str(pat.Email)) if pat.Email else None,
-            clinic_id = self.clinic_id,
-            pat_num = None
+        # single INSERT ... ON CONFLICT DO NOTHING ... RETURNING replaces the
+        # add/commit/IntegrityError-retry dance with one race-free statement
+        stmt = (
+            pg_insert(Patients)
+            .values(
+                contact_id = encrypt_secret(contact_id),
+                contact_id_hash=contact_hash,
+                FName = encrypt_secret(pat.FName) if pat.FName else None,
+                LName = encrypt_secret(pat.LName) if pat.LName else None,
+                Gender = pat.Gender,
+                phone = encrypt_secret(pat.WirelessPhone) if pat.WirelessPhone else "",
+                email = encrypt_secret(str(pat.Email)) if pat.Email else None,
+                clinic_id = self.clinic_id,
+                pat_num = None,
+            )
+            .on_conflict_do_nothing(index_elements=["clinic_id", "contact_id_hash"])
+            .returning(Patients)
         )
 
         try:
-            self.db.add(row)
+            row = self.db.execute(stmt).scalars().first()
             self.db.commit()
-            self.db.refresh(row)
-            return row 
-        
-        except IntegrityError:
+        except SQLAlchemyError:
             self.db.rollback()
+            raise
+
+        if row is None:
+            # another worker won the insert; read their row
             row = (
                 self.db.query(Patients)
                 .filter_by(clinic_id=self.clinic_id, contact_id_hash=contact_hash)
                 .first()
-            ) 
-            return row
+            )
+        return row
         
     async  def finalize_into_db(self, row: Patients, pat_num):
         try:
@@ -18,6 +18,7 @@ from api.routers.toroforge_endpoint import toroforge_wallet_transfer
 from api.routers.toroforge_endpoint import toroforge_wallet_creation
 from api.routers.toroforge_endpoint import toroforge_billing_wallet_read
 from api.routers.toroforge_endpoint import toroforge_funding
+from sdk import http_client
 
 
 log = logging.getLogger("uvicorn.error")
@@ -67,6 +68,17 @@ def verify_db_on_start():
         log.error(msg)
 
 
+@app.on_event("shutdown")
+async def close_http_client_on_shutdown():
+    await http_client.close_shared_client()
+
+
 @app.get("/")
 async def root():
     return {"status": "running", "message": "Welcome to PMS CRM Sync API"}
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
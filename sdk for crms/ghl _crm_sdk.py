@@ -1,4 +1,4 @@
-import httpx
+from sdk.http_client import get_shared_client
 from core.circuti_breaker import  circuit_breaker, circuit_breaker_open_error
 from core.utils import create_contacts, create_appointments, update_appointments
 from core.schemas import create_contact_ghl, create_appointment_ghl, update_appointment_ghl
@@ -26,15 +26,14 @@ class GHL():
             raise circuit_breaker_open_error("Too Many Failures Wait for sometime")
         
         async def send():
-            async with httpx.AsyncClient(timeout= 15 ) as client:
-                response = await client.request(
-                    method = method.upper(),
-                    url = url,
-                   headers = self.headers ,
-                   **kwargs,
-                )
-                response.raise_for_status()
-                return response
+            response = await get_shared_client().request(
+                method = method.upper(),
+                url = url,
+               headers = self.headers ,
+               **kwargs,
+            )
+            response.raise_for_status()
+            return response
         try:
             response = await retry_with_bak_off(send)
             self.cb.success()
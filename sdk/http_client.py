@@ -0,0 +1,42 @@
+import asyncio
+
+import httpx
+
+# shared pool settings for all outbound SDK calls, so connections are reused
+# instead of a new TCP/TLS handshake per request
+_TIMEOUT = httpx.Timeout(15.0, connect=5.0)
+_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
+# keepalive connections bind to the loop that created them, and each worker
+# job runs under its own asyncio.run; a single module-level client would hand
+# job 2 a pool tied to job 1's closed loop. Key the client by running loop so
+# the server loop keeps one long-lived pool and each job loop gets its own.
+_clients: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            # fail fast on connect, leave the old 15s budget for slow responses
+            timeout=_TIMEOUT,
+            limits=_LIMITS,
+            # multiplexes concurrent calls onto one TLS session where the
+            # upstream speaks HTTP/2; ALPN falls back to HTTP/1.1 otherwise
+            http2=True,
+        )
+        _clients[loop] = client
+    return client
+
+
+async def close_shared_client():
+    """Close and forget the current loop's client; called from the app
+    shutdown hook and at the end of every worker job."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None and not client.is_closed:
+        await client.aclose()
@@ -1,7 +1,7 @@
 from core.database import SessionLocal
 from fastapi import HTTPException, status
 from core.models import RegisteredClinics, Patients
-import httpx
+from sdk.http_client import get_shared_client
 from core.utils import patient_payload, appointment_payload, appointment_payload_update, create_commlog, create_pops, retry_with_bak_off
 from core.circuti_breaker import CircuitBreaker, CircuitBreakerOpenError
 from core.schemas import patient_model, Appointments_create, Appointments_update, create_commslogs, create_pop_ups
@@ -19,15 +19,25 @@ class openDentalApi:
         name= "opendental"
     )
 
-    def __init__(self, clinic_id: UUID) -> None:
-        self.db = SessionLocal()
-        clinic =self.db.query(RegisteredClinics).filter_by(id=clinic_id).first()
-        if not clinic:
-            raise HTTPException(status.HTTP_404_NOT_FOUND, detail="clinic not found ")
-        
-        self.developer_key = clinic.od_developer_key
-        self.customer_key = clinic.od_customer_key
-        self.clinic_num = clinic.clinic_number
+    def __init__(self, clinic_id: UUID, clinic: RegisteredClinics | None = None) -> None:
+        # callers that already hold the clinic row pass it in; otherwise we
+        # open a short-lived session just to read the credentials once
+        if clinic is None:
+            db = SessionLocal()
+            try:
+                clinic = db.query(RegisteredClinics).filter_by(id=clinic_id).first()
+                if not clinic:
+                    raise HTTPException(status.HTTP_404_NOT_FOUND, detail="clinic not found ")
+                self.developer_key = clinic.od_developer_key
+                self.customer_key = clinic.od_customer_key
+                self.clinic_num = clinic.clinic_number
+            finally:
+                db.close()
+        else:
+            self.developer_key = clinic.od_developer_key
+            self.customer_key = clinic.od_customer_key
+            self.clinic_num = clinic.clinic_number
+
         self.base_url = "https://api.opendental.io/api/v1"
         self.headers = {
             "OD-Developer-Key": self.developer_key,
@@ -51,10 +61,9 @@ class openDentalApi:
                     kwargs["json"] = {}
                 kwargs["json"]["ClinicNum"] = self.clinic_num
 
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response =   await client.request(method, url, headers= self.headers, **kwargs)
-                response.raise_for_status()
-                return response
+            response =   await get_shared_client().request(method, url, headers= self.headers, **kwargs)
+            response.raise_for_status()
+            return response
                 
         try:
            response = await retry_with_bak_off(send)
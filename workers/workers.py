@@ -1,6 +1,7 @@
 from core.database import SessionLocal
 from core.models import Patients, RegisteredClinics, InboundEvent, AppointmentSyncLog,Appointments, SyncFailureSource
 from sdk.opendental_sdk import openDentalApi
+from sdk.http_client import close_shared_client
 from fastapi import HTTPException
 from core.schemas import patient_model
 from infra.appointment_service import AppointmentService,  CustomerConfigurationSyncError, OpenDentalSyncError, InternalSyncError
@@ -9,6 +10,7 @@ from infra.patient_creation import PatientService
 from auth.security import fingerprint_value
 from core.schemas import AppointmentRequest
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import undefer_group
 from core.circuti_breaker import CircuitBreakerOpenError
 from rq import get_current_job
 from datetime import datetime, timezone
@@ -84,6 +86,14 @@ async def process_crm_load(clinic_id: UUID, crm_type: str, payload: dict, sync_l
     job = get_current_job()
     current_job_id = job.id if job else None 
 
+    # constant for the whole job; build it once instead of per log call
+    log_ctx = {
+        "clinic_id": clinic_id,
+        "crm_type": crm_type,
+        "event_id": payload.get("event_id"),
+        "contact_ref": fingerprint_value(payload.get("contact_id")),
+    }
+
     sync_log_service= AppointmentSyncLogService(db)
     try:
         sync_log = db.query(AppointmentSyncLog).filter_by(id = sync_log_id).first()
@@ -93,14 +103,14 @@ async def process_crm_load(clinic_id: UUID, crm_type: str, payload: dict, sync_l
         if sync_log:
             sync_log_service.mark_processing(sync_log)
 
-        logger.info("CRM job started", extra={
-            "clinic_id": clinic_id,
-            "crm_type": crm_type,
-            "event_id": payload.get("event_id"),
-            "contact_ref": fingerprint_value(payload.get("contact_id")),
-        })
+        logger.info("CRM job started", extra=log_ctx)
 
-        clinic = db.query(RegisteredClinics).filter_by(id=clinic_id).first()
+        clinic = (
+            db.query(RegisteredClinics)
+            .options(undefer_group("secrets"))
+            .filter_by(id=clinic_id)
+            .first()
+        )
         if not clinic:
             raise ValueError("clinic id  {clinic} not found ")
 
@@ -116,9 +126,7 @@ async def process_crm_load(clinic_id: UUID, crm_type: str, payload: dict, sync_l
             Email=payload.get("Email"),
         )
         logger.info("Patient payload mapped", extra={
-            "clinic_id": clinic_id,
-            "event_id": payload.get("event_id"),
-            "contact_ref": fingerprint_value(payload.get("contact_id")),
+            **log_ctx,
             "has_fname": bool(patient_data.FName),
             "has_lname": bool(patient_data.LName),
             "has_birthdate": bool(patient_data.Birthdate),
@@ -138,7 +146,7 @@ async def process_crm_load(clinic_id: UUID, crm_type: str, payload: dict, sync_l
 
 
 
-        od = openDentalApi(clinic_id)
+        od = openDentalApi(clinic_id, clinic=clinic)
         pat = PatientService(db, od, clinic_id)
         result = await pat.resolve_patnum(pat=patient_data, contact_id=contact_id)
         if result is None:
@@ -146,9 +154,7 @@ async def process_crm_load(clinic_id: UUID, crm_type: str, payload: dict, sync_l
 
         pat_id, pat_num = result
         logger.info("Resolved patient identifiers", extra={
-            "clinic_id": clinic_id,
-            "event_id": event_id,
-            "contact_ref": contact_ref,
+            **log_ctx,
             "has_patient": True,
         })
 
@@ -168,9 +174,7 @@ async def process_crm_load(clinic_id: UUID, crm_type: str, payload: dict, sync_l
             pat_id=pat_id,
         )
         logger.info("Appointment request prepared", extra={
-            "clinic_id": clinic_id,
-            "event_id": event_id,
-            "contact_ref": contact_ref,
+            **log_ctx,
             "calendar_id": calendar_id,
             "status": status,
             "date_str": date_str,
@@ -190,9 +194,7 @@ async def process_crm_load(clinic_id: UUID, crm_type: str, payload: dict, sync_l
         
         apt_num = booking.apt_num
         logger.info("Appointment booked", extra={
-            "clinic_id": clinic_id,
-            "event_id": event_id,
-            "contact_ref": contact_ref,
+            **log_ctx,
             "apt_num": apt_num,
         })
 
@@ -208,12 +210,7 @@ async def process_crm_load(clinic_id: UUID, crm_type: str, payload: dict, sync_l
         db.rollback()
         logger.warning(
             "Too many failures; circuit breaker is open",
-            extra={
-                "clinic_id": clinic_id,
-                "crm_type": crm_type,
-                "event_id": payload.get("event_id"),
-                "contact_ref": fingerprint_value(payload.get("contact_id")),
-            },
+            extra=log_ctx,
         )
         _mark_event_retry_or_failure(db, current_job_id, job, e)
         sync_log = db.query(AppointmentSyncLog).filter_by(id=sync_log_id).first()
@@ -225,12 +222,7 @@ async def process_crm_load(clinic_id: UUID, crm_type: str, payload: dict, sync_l
         db.rollback()
         logger.warning(
             "Customer configuration caused sync failure",
-            extra={
-                "clinic_id": clinic_id,
-                "crm_type": crm_type,
-                "event_id": payload.get("event_id"),
-                "contact_ref": fingerprint_value(payload.get("contact_id")),
-            },
+            extra=log_ctx,
         )
         _mark_event_result(db, current_job_id, job, status="failed", failure_reason=str(e))
         sync_log = db.query(AppointmentSyncLog).filter_by(id=sync_log_id).first()
@@ -248,12 +240,7 @@ async def process_crm_load(clinic_id: UUID, crm_type: str, payload: dict, sync_l
         db.rollback()
         logger.warning(
             "OpenDental caused sync failure",
-            extra={
-                "clinic_id": clinic_id,
-                "crm_type": crm_type,
-                "event_id": payload.get("event_id"),
-                "contact_ref": fingerprint_value(payload.get("contact_id")),
-            },
+            extra=log_ctx,
         )
         _mark_event_retry_or_failure(db, current_job_id, job, e)
         sync_log = db.query(AppointmentSyncLog).filter_by(id=sync_log_id).first()
@@ -270,12 +257,7 @@ async def process_crm_load(clinic_id: UUID, crm_type: str, payload: dict, sync_l
         db.rollback()
         logger.exception(
             "Internal sync processing failure",
-            extra={
-                "clinic_id": clinic_id,
-                "crm_type": crm_type,
-                "event_id": payload.get("event_id"),
-                "contact_ref": fingerprint_value(payload.get("contact_id")),
-            },
+            extra=log_ctx,
         )
         _mark_event_retry_or_failure(db, current_job_id, job, e)
         sync_log = db.query(AppointmentSyncLog).filter_by(id=sync_log_id).first()
@@ -292,12 +274,7 @@ async def process_crm_load(clinic_id: UUID, crm_type: str, payload: dict, sync_l
         db.rollback()
         logger.exception(
             f"Error processing patient: {e}",
-            extra={
-                "clinic_id": clinic_id,
-                "crm_type": crm_type,
-                "event_id": payload.get("event_id"),
-                "contact_ref": fingerprint_value(payload.get("contact_id")),
-            },
+            extra=log_ctx,
         )
         _mark_event_retry_or_failure(db, current_job_id, job, e)
         sync_log = db.query(AppointmentSyncLog).filter_by(id=sync_log_id).first()
@@ -308,12 +285,7 @@ async def process_crm_load(clinic_id: UUID, crm_type: str, payload: dict, sync_l
         db.rollback()
         logger.exception(
             "Unexpected error while processing CRM load",
-            extra={
-                "clinic_id": clinic_id,
-                "crm_type": crm_type,
-                "event_id": payload.get("event_id"),
-                "contact_ref": fingerprint_value(payload.get("contact_id")),
-            },
+            extra=log_ctx,
         )
         _mark_event_retry_or_failure(db, current_job_id, job, e)
         sync_log = db.query(AppointmentSyncLog).filter_by(id=sync_log_id).first()
@@ -321,4 +293,7 @@ async def process_crm_load(clinic_id: UUID, crm_type: str, payload: dict, sync_l
         raise
 
     finally:
+        # this job's loop dies with asyncio.run; drop its pooled client so the
+        # registry doesn't accumulate clients bound to dead loops
+        await close_shared_client()
         db.close()